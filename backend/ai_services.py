@@ -4,90 +4,459 @@ Handles summarization, topic modeling, and insight generation
 """
 
 import os
-import json
-from typing import Dict, List, Optional
+import orjson
+import time
+import asyncio
+import hashlib
+import threading
+import unicodedata
+import uuid
+from typing import Callable, Dict, Iterator, List, Optional
 import logging
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict, deque
 import re
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor
+from groq import Groq, AsyncGroq, RateLimitError
 import httpx
 from dotenv import load_dotenv
+from text_utils import count_keywords
+
+try:
+    import redis
+except ImportError:  # Redis is optional; an in-process LRU is used instead
+    redis = None
 
 load_dotenv()
 
+# Connection settings for the Groq HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Exact-match completion cache settings
+RESPONSE_CACHE_TTL = int(os.getenv("GROQ_CACHE_TTL", 24 * 60 * 60))
+RESPONSE_CACHE_SIZE = 4096
+
+# Semantic cache for answer_question: paraphrased questions above this
+# cosine similarity reuse the stored answer
+QA_CACHE_COLLECTION = "qa_cache"
+QA_CACHE_SIMILARITY = 0.92
+QA_CACHE_TTL = int(os.getenv("QA_CACHE_TTL", 7 * 24 * 60 * 60))
+QA_CACHE_EVICT_EVERY = 100
+
+# Streamed tokens are flushed to the client in groups of this size
+STREAM_FLUSH_TOKENS = 50
+
+
+class _ResponseCache:
+    """Exact-match cache for completions: Redis when REDIS_URL is set, otherwise an in-process LRU"""
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = RESPONSE_CACHE_TTL,
+                 maxsize: int = RESPONSE_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        if redis_url and redis is not None:
+            try:
+                self._redis = redis.Redis.from_url(redis_url)
+                self._redis.ping()
+            except Exception as e:
+                logging.warning(f"Redis cache unavailable, using in-process cache: {str(e)}")
+                self._redis = None
+
+    def get(self, key: str) -> Optional[str]:
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+                return orjson.loads(raw)["content"] if raw else None
+            except Exception as e:
+                logging.warning(f"Redis cache read failed: {str(e)}")
+                return None
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["ts"] > self.ttl:
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry["content"]
+
+    def set(self, key: str, content: str, metadata: Dict):
+        entry = {"content": content, "ts": time.time(), **metadata}
+        if self._redis is not None:
+            try:
+                self._redis.setex(key, self.ttl, orjson.dumps(entry))
+            except Exception as e:
+                logging.warning(f"Redis cache write failed: {str(e)}")
+            return
+
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+RATE_LIMIT_WINDOW = 60.0
+RATE_LIMIT_RETRIES = 4
+
+
+def _estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token budget for a call: ~4 chars per prompt token plus the completion cap"""
+    return len(prompt) // 4 + max_tokens
+
+
+def _retry_delay(error: RateLimitError, attempt: int) -> float:
+    """Honor the Retry-After header when present, else back off exponentially"""
+    retry_after = error.response.headers.get("retry-after") if error.response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+def _is_json(content: str) -> bool:
+    """True if a completion parses as JSON (cache validator for JSON prompts)"""
+    try:
+        orjson.loads(content)
+        return True
+    except orjson.JSONDecodeError:
+        return False
+
+
+class _RateLimiter:
+    """Sliding-window limiter on requests and tokens per minute, shared by sync and async calls"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._events = deque()  # (timestamp, tokens) of calls inside the window
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve budget for a call; return 0 on success or the seconds to wait"""
+        tokens = min(tokens, self.tpm)
+        with self._lock:
+            now = time.monotonic()
+            while self._events and now - self._events[0][0] >= RATE_LIMIT_WINDOW:
+                self._tokens -= self._events.popleft()[1]
+
+            if len(self._events) < self.rpm and self._tokens + tokens <= self.tpm:
+                self._events.append((now, tokens))
+                self._tokens += tokens
+                return 0.0
+            return max(RATE_LIMIT_WINDOW - (now - self._events[0][0]), 0.01)
+
+    def acquire(self, tokens: int):
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int):
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+
 class GroqAIService:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, embedding_model=None, chroma_client=None,
+                 embedding_model_tag: Optional[str] = None):
         # Prefer explicit api_key, otherwise fall back to env
         api_key = api_key or os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY is not set. Provide it via constructor or environment.")
         # Workaround httpx>=0.27 removal of 'proxies' kwarg used by some SDK versions
         # By supplying our own httpx.Client, we bypass the SDK's internal wrapper
-        httpx_client = httpx.Client()
+        # HTTP/2 with a keep-alive pool lets concurrent calls share one TLS connection
+        httpx_client = httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
         self.client = Groq(api_key=api_key, http_client=httpx_client)
+        # Async client for callers already running their own event loop; request
+        # handlers stay synchronous (no asyncio.run under gevent workers)
+        self.api_key = api_key
+        self.aclient = AsyncGroq(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
         # Allow model selection via env; default to a fast instant model
         self.model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+        self.cache = _ResponseCache(os.getenv("REDIS_URL"))
+        self.rate_limiter = _RateLimiter(
+            rpm=int(os.getenv("GROQ_RPM", 30)),
+            tpm=int(os.getenv("GROQ_TPM", 30000))
+        )
         
+        # Semantic question cache shares the API's embedding model and ChromaDB client
+        self.embedding_model = embedding_model
+        self.qa_cache = None
+        self._qa_cache_writes = 0
+        if embedding_model is not None and chroma_client is not None:
+            # One collection per model variant: vectors from different variants aren't comparable
+            collection_name = QA_CACHE_COLLECTION
+            if embedding_model_tag:
+                collection_name += "_" + re.sub(r"[^A-Za-z0-9._-]", "_", embedding_model_tag)
+            self.qa_cache = chroma_client.get_or_create_collection(
+                collection_name,
+                metadata={"hnsw:space": "cosine"}
+            )
+        
+    def _cache_key(self, prompt: str, temperature: float) -> str:
+        """Key identical requests by model, temperature and normalized prompt"""
+        return hashlib.sha256(f"{self.model}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+
+    def _normalize_prompt(self, prompt: str) -> str:
+        return unicodedata.normalize("NFC", prompt.strip())
+
+    def _create_completion(self, prompt: str, temperature: float, max_tokens: int, stream: bool = False):
+        """Call Groq within the rate-limit budget, backing off and retrying on 429s"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire(_estimate_tokens(prompt, max_tokens))
+            try:
+                return self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=stream,
+                )
+            except RateLimitError as e:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logging.warning(f"Groq rate limit hit, retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def _acreate_completion(self, aclient: AsyncGroq, prompt: str, temperature: float, max_tokens: int):
+        """Async variant of _create_completion"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self.rate_limiter.aacquire(_estimate_tokens(prompt, max_tokens))
+            try:
+                return await aclient.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            except RateLimitError as e:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logging.warning(f"Groq rate limit hit, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _cached_completion(self, prompt: str, temperature: float, max_tokens: int,
+                           validate: Optional[Callable[[str], bool]] = None) -> str:
+        """Run a chat completion, serving identical requests from the response cache.
+        Responses rejected by `validate` are returned but not cached, so the next call retries.
+        """
+        prompt = self._normalize_prompt(prompt)
+        key = self._cache_key(prompt, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._create_completion(prompt, temperature, max_tokens)
+        content = response.choices[0].message.content
+        self._cache_if_valid(key, content, temperature, validate)
+        return content
+
+    async def _acached_completion(self, prompt: str, temperature: float, max_tokens: int,
+                                  aclient: Optional[AsyncGroq] = None,
+                                  validate: Optional[Callable[[str], bool]] = None) -> str:
+        """Async variant of _cached_completion"""
+        prompt = self._normalize_prompt(prompt)
+        key = self._cache_key(prompt, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self._acreate_completion(aclient or self.aclient, prompt, temperature, max_tokens)
+        content = response.choices[0].message.content
+        self._cache_if_valid(key, content, temperature, validate)
+        return content
+
+    def _cache_if_valid(self, key: str, content: str, temperature: float,
+                        validate: Optional[Callable[[str], bool]]):
+        """Store a completion unless the caller's validator rejects (or fails on) it"""
+        if validate is not None:
+            try:
+                if not validate(content):
+                    return
+            except Exception:
+                return
+        self.cache.set(key, content, {"model": self.model, "temperature": temperature})
+
+    def _stream_completion(self, prompt: str, temperature: float, max_tokens: int) -> Iterator[str]:
+        """Stream a chat completion in small batches of tokens, filling the response cache at the end"""
+        prompt = self._normalize_prompt(prompt)
+        key = self._cache_key(prompt, temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        stream = self._create_completion(prompt, temperature, max_tokens, stream=True)
+
+        # The first token goes out immediately; later ones are grouped to
+        # keep per-event overhead down for many concurrent clients
+        pieces, buffer = [], []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            pieces.append(delta)
+            buffer.append(delta)
+            if len(pieces) == 1 or len(buffer) >= STREAM_FLUSH_TOKENS:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+
+        self.cache.set(key, "".join(pieces), {"model": self.model, "temperature": temperature})
+
+    def _article_text(self, article: Dict) -> str:
+        """Combine the article fields used as summarization input"""
+        return (
+            f"Title: {article.get('title', '')}\n\n"
+            f"Results: {article.get('results_full', '')}\n\n"
+            f"Summary: {article.get('results_summary', '')}"
+        )
+
+    def _numbered_sections(self, label: str, texts: List[str]) -> str:
+        """Join texts into one prompt block with numbered delimiters"""
+        return "\n\n".join(f"[{label} {i}]\n{text}" for i, text in enumerate(texts, 1))
+
+    def _summary_result(self, article: Dict, summary: Dict, confidence: float = 0.8) -> Dict:
+        """Wrap a parsed summary with the article it belongs to"""
+        return {
+            "article_id": article.get('article_id'),
+            "title": article.get('title', ''),
+            "ai_summary": summary,
+            "confidence": confidence
+        }
+
+    def _summary_prompt(self, article: Dict) -> str:
+        """Build the single-article summarization prompt"""
+        return f"""
+            Analyze this NASA bioscience research article and provide a structured summary:
+            
+            {self._article_text(article)}
+            
+            Please provide:
+            1. Key Findings (2-3 bullet points)
+            2. Research Methods Used
+            3. Biological Systems Studied
+            4. Space Environment Effects Observed
+            5. Potential Applications/Implications
+            
+            Format as JSON with these keys: key_findings, methods, biological_systems, space_effects, applications
+            """
+
+    def _parse_summary(self, content: str) -> Dict:
+        """Parse a summary response, falling back to the raw text"""
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return {
+                "key_findings": [content],
+                "methods": ["Analysis of research article"],
+                "biological_systems": ["Various biological systems"],
+                "space_effects": ["Space environment effects"],
+                "applications": ["Research applications"]
+            }
+
     def summarize_article(self, article: Dict) -> Dict:
         """Generate AI summary for a single article"""
         try:
-            title = article.get('title', '')
-            results_full = article.get('results_full', '')
-            results_summary = article.get('results_summary', '')
+            content = self._cached_completion(
+                self._summary_prompt(article),
+                temperature=0.3,
+                max_tokens=1000,
+                validate=_is_json,
+            )
             
-            # Combine text for summarization
-            text_to_summarize = f"Title: {title}\n\nResults: {results_full}\n\nSummary: {results_summary}"
+            summary = self._parse_summary(content)
+            return self._summary_result(article, summary)
+            
+        except Exception as e:
+            logging.error(f"Error summarizing article {article.get('article_id')}: {str(e)}")
+            return self._summary_result(article, {"error": "Summary generation failed"}, confidence=0.0)
+    
+    async def asummarize_article(self, article: Dict, aclient: Optional[AsyncGroq] = None) -> Dict:
+        """Async variant of summarize_article"""
+        try:
+            content = await self._acached_completion(
+                self._summary_prompt(article),
+                temperature=0.3,
+                max_tokens=1000,
+                aclient=aclient,
+                validate=_is_json,
+            )
+            
+            summary = self._parse_summary(content)
+            return self._summary_result(article, summary)
+            
+        except Exception as e:
+            logging.error(f"Error summarizing article {article.get('article_id')}: {str(e)}")
+            return self._summary_result(article, {"error": "Summary generation failed"}, confidence=0.0)
+    
+    def summarize_many(self, articles: List[Dict], concurrency: int = 8) -> List[Dict]:
+        """Summarize articles one per call, running up to `concurrency` calls at once"""
+        # Threads rather than asyncio.run: under gevent workers they are greenlets
+        # sharing the worker's hub, and the sync client's HTTP/2 pool is thread-safe
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.summarize_article, articles))
+    
+    def summarize_articles_batch(self, articles: List[Dict], b: int = 8) -> List[Dict]:
+        """Generate AI summaries for many articles, packing b articles into each Groq call"""
+        summaries = []
+        for start in range(0, len(articles), b):
+            summaries.extend(self._summarize_sub_batch(articles[start:start + b]))
+        return summaries
+    
+    @staticmethod
+    def _is_summary_batch(summaries, n: int) -> bool:
+        """A batch reply must be a JSON array with one summary per article"""
+        return isinstance(summaries, list) and len(summaries) == n
+
+    def _summarize_sub_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Summarize one sub-batch in a single call, falling back to per-article calls"""
+        try:
+            sections = self._numbered_sections("ARTICLE", [self._article_text(a) for a in batch])
             
             prompt = f"""
-            Analyze this NASA bioscience research article and provide a structured summary:
+            Analyze these {len(batch)} NASA bioscience research articles and provide a structured summary of each:
             
-            {text_to_summarize}
+            {sections}
             
-            Please provide:
+            For each article provide:
             1. Key Findings (2-3 bullet points)
             2. Research Methods Used
             3. Biological Systems Studied
             4. Space Environment Effects Observed
             5. Potential Applications/Implications
             
-            Format as JSON with these keys: key_findings, methods, biological_systems, space_effects, applications
+            Return a JSON array of summaries, one per article, in order.
+            Each summary is a JSON object with these keys: key_findings, methods, biological_systems, space_effects, applications
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = self._cached_completion(
+                prompt,
                 temperature=0.3,
-                max_tokens=1000,
+                max_tokens=len(batch) * 1000,
+                validate=lambda c: self._is_summary_batch(orjson.loads(c), len(batch)),
             )
             
-            # Try to parse JSON response
-            try:
-                summary = json.loads(response.choices[0].message.content)
-            except json.JSONDecodeError:
-                # Fallback to text response
-                summary = {
-                    "key_findings": [response.choices[0].message.content],
-                    "methods": ["Analysis of research article"],
-                    "biological_systems": ["Various biological systems"],
-                    "space_effects": ["Space environment effects"],
-                    "applications": ["Research applications"]
-                }
+            summaries = orjson.loads(content)
+            if not self._is_summary_batch(summaries, len(batch)):
+                raise ValueError(f"expected {len(batch)} summaries in a JSON array")
             
-            return {
-                "article_id": article.get('article_id'),
-                "title": title,
-                "ai_summary": summary,
-                "confidence": 0.8
-            }
+            return [self._summary_result(a, s) for a, s in zip(batch, summaries)]
             
         except Exception as e:
-            logging.error(f"Error summarizing article {article.get('article_id')}: {str(e)}")
-            return {
-                "article_id": article.get('article_id'),
-                "title": article.get('title', ''),
-                "ai_summary": {"error": "Summary generation failed"},
-                "confidence": 0.0
-            }
+            logging.warning(f"Batch summarization failed, retrying articles concurrently: {str(e)}")
+            return self.summarize_many(batch)
     
     def generate_topic_clusters(self, articles: List[Dict]) -> Dict:
         """Generate AI-powered topic clusters from articles"""
@@ -125,17 +494,17 @@ class GroqAIService:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = self._cached_completion(
+                prompt,
                 temperature=0.4,
                 max_tokens=1500,
+                validate=_is_json,
             )
             
             try:
-                topics_data = json.loads(response.choices[0].message.content)
+                topics_data = orjson.loads(content)
                 return topics_data
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Fallback topic generation
                 return self._fallback_topic_generation(articles)
                 
@@ -158,7 +527,7 @@ class GroqAIService:
             'expression', 'differentiation', 'apoptosis', 'proliferation'
         ]
         
-        keyword_counts = {kw: all_text.count(kw) for kw in keywords}
+        keyword_counts = count_keywords(all_text, keywords)
         sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
         
         # Create simple topics
@@ -218,17 +587,17 @@ class GroqAIService:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = self._cached_completion(
+                prompt,
                 temperature=0.5,
                 max_tokens=1200,
+                validate=_is_json,
             )
             
             try:
-                insights = json.loads(response.choices[0].message.content)
+                insights = orjson.loads(content)
                 return insights
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return self._fallback_insights(articles, entity_names)
                 
         except Exception as e:
@@ -259,22 +628,110 @@ class GroqAIService:
             }
         }
     
+    def _qa_cache_lookup(self, question: str):
+        """Return (question embedding, cached answer or None) from the semantic cache"""
+        embedding = self.embedding_model.encode(question, normalize_embeddings=True).tolist()
+        if self.qa_cache.count() == 0:
+            return embedding, None
+        
+        hits = self.qa_cache.query(query_embeddings=[embedding], n_results=1)
+        if not hits['ids'][0]:
+            return embedding, None
+        
+        similarity = 1 - hits['distances'][0][0]
+        metadata = hits['metadatas'][0][0]
+        if similarity < QA_CACHE_SIMILARITY or time.time() - metadata['ts'] > QA_CACHE_TTL:
+            return embedding, None
+        
+        return embedding, {
+            "answer": metadata['answer'],
+            "confidence": metadata['confidence'],
+            "sources": orjson.loads(metadata['sources'])
+        }
+    
+    def _qa_cache_store(self, question: str, embedding: List[float], result: Dict):
+        """Store an answer in the semantic cache, evicting expired entries periodically"""
+        self.qa_cache.add(
+            documents=[question],
+            embeddings=[embedding],
+            metadatas=[{
+                "answer": result['answer'],
+                "confidence": result['confidence'],
+                "sources": orjson.dumps(result['sources']).decode('utf-8'),
+                "ts": time.time()
+            }],
+            ids=[uuid.uuid4().hex]
+        )
+        
+        self._qa_cache_writes += 1
+        if self._qa_cache_writes % QA_CACHE_EVICT_EVERY == 0:
+            self.qa_cache.delete(where={"ts": {"$lt": time.time() - QA_CACHE_TTL}})
+    
+    def _relevant_articles(self, question: str, articles: List[Dict], limit: int = 5,
+                           search_texts: Optional[List[str]] = None) -> List[Dict]:
+        """Find articles sharing a word with the question.
+        search_texts optionally holds precomputed lowercased text aligned with articles.
+        """
+        relevant_articles = []
+        question_words = question.lower().split()
+        
+        if search_texts is None:
+            search_texts = (
+                f"{a.get('title', '')} {a.get('results_summary', '')}".lower() for a in articles
+            )
+        
+        for article, text in zip(articles, search_texts):
+            if article.get('has_results'):
+                if any(word in text for word in question_words):
+                    relevant_articles.append(article)
+        
+        return relevant_articles[:limit]
+    
+    def _question_prompt(self, question: str, relevant_articles: List[Dict]) -> str:
+        """Build the question-answering prompt from the relevant articles"""
+        context = "\n\n".join([
+            f"Article: {a.get('title', '')}\nSummary: {a.get('results_summary', '')[:300]}"
+            for a in relevant_articles
+        ])
+        
+        return f"""
+            Based on this NASA bioscience research context, answer the question:
+            
+            Question: {question}
+            
+            Research Context:
+            {context}
+            
+            Please provide a concise, evidence-based answer. If the information is not available, say so clearly.
+            """
+    
+    def _cached_question_answer(self, question: str):
+        """Return (question embedding, cached answer or None) when the semantic cache is enabled"""
+        if self.qa_cache is None:
+            return None, None
+        try:
+            return self._qa_cache_lookup(question)
+        except Exception as e:
+            logging.warning(f"Semantic cache lookup failed: {str(e)}")
+            return None, None
+    
+    def _store_question_answer(self, question: str, question_embedding: Optional[List[float]], result: Dict):
+        if question_embedding is None:
+            return
+        try:
+            self._qa_cache_store(question, question_embedding, result)
+        except Exception as e:
+            logging.warning(f"Semantic cache write failed: {str(e)}")
+    
     def answer_question(self, question: str, articles: List[Dict], 
-                       knowledge_graph_data: Dict) -> Dict:
+                       knowledge_graph_data: Dict, search_texts: Optional[List[str]] = None) -> Dict:
         """Answer questions about the research corpus"""
         try:
-            # Find relevant articles
-            relevant_articles = []
-            question_lower = question.lower()
+            question_embedding, cached = self._cached_question_answer(question)
+            if cached is not None:
+                return cached
             
-            for article in articles:
-                if article.get('has_results'):
-                    text = f"{article.get('title', '')} {article.get('results_summary', '')}".lower()
-                    if any(word in text for word in question_lower.split()):
-                        relevant_articles.append(article)
-            
-            # Limit to top 5 most relevant
-            relevant_articles = relevant_articles[:5]
+            relevant_articles = self._relevant_articles(question, articles, search_texts=search_texts)
             
             if not relevant_articles:
                 return {
@@ -283,37 +740,19 @@ class GroqAIService:
                     "sources": []
                 }
             
-            # Prepare context
-            context = "\n\n".join([
-                f"Article: {a.get('title', '')}\nSummary: {a.get('results_summary', '')[:300]}"
-                for a in relevant_articles
-            ])
-            
-            prompt = f"""
-            Based on this NASA bioscience research context, answer the question:
-            
-            Question: {question}
-            
-            Research Context:
-            {context}
-            
-            Please provide a concise, evidence-based answer. If the information is not available, say so clearly.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            answer = self._cached_completion(
+                self._question_prompt(question, relevant_articles),
                 temperature=0.3,
                 max_tokens=500,
             )
             
-            answer = response.choices[0].message.content
-            
-            return {
+            result = {
                 "answer": answer,
                 "confidence": 0.8,
                 "sources": [a.get('article_id') for a in relevant_articles]
             }
+            self._store_question_answer(question, question_embedding, result)
+            return result
             
         except Exception as e:
             logging.error(f"Error answering question: {str(e)}")
@@ -323,6 +762,45 @@ class GroqAIService:
                 "sources": []
             }
     
+    def answer_question_stream(self, question: str, articles: List[Dict],
+                               knowledge_graph_data: Dict,
+                               search_texts: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Stream an answer as {"token": ...} events, ending with a {"done": True, ...} event"""
+        try:
+            question_embedding, cached = self._cached_question_answer(question)
+            if cached is not None:
+                yield {"token": cached['answer']}
+                yield {"done": True, "confidence": cached['confidence'], "sources": cached['sources']}
+                return
+            
+            relevant_articles = self._relevant_articles(question, articles, search_texts=search_texts)
+            
+            if not relevant_articles:
+                yield {"token": "I couldn't find relevant information to answer your question."}
+                yield {"done": True, "confidence": 0.0, "sources": []}
+                return
+            
+            pieces = []
+            for text in self._stream_completion(
+                self._question_prompt(question, relevant_articles),
+                temperature=0.3,
+                max_tokens=500,
+            ):
+                pieces.append(text)
+                yield {"token": text}
+            
+            result = {
+                "answer": "".join(pieces),
+                "confidence": 0.8,
+                "sources": [a.get('article_id') for a in relevant_articles]
+            }
+            self._store_question_answer(question, question_embedding, result)
+            yield {"done": True, "confidence": result['confidence'], "sources": result['sources']}
+            
+        except Exception as e:
+            logging.error(f"Error streaming answer: {str(e)}")
+            yield {"error": "I encountered an error while processing your question."}
+    
     def generate_sentiment_analysis(self, articles: List[Dict]) -> Dict:
         """Analyze sentiment of research outcomes"""
         try:
@@ -332,7 +810,7 @@ class GroqAIService:
                 if a.get('has_results') and a.get('results_summary')
             ][:30]  # Limit for API efficiency
             
-            combined_results = "\n\n".join(results_texts)
+            combined_results = self._numbered_sections("RESULT", results_texts)
             
             prompt = f"""
             Analyze the sentiment of these research findings from NASA bioscience studies:
@@ -353,17 +831,17 @@ class GroqAIService:
             Format as JSON with sentiment distribution and examples.
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = self._cached_completion(
+                prompt,
                 temperature=0.2,
                 max_tokens=800,
+                validate=_is_json,
             )
             
             try:
-                sentiment_data = json.loads(response.choices[0].message.content)
+                sentiment_data = orjson.loads(content)
                 return sentiment_data
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return self._fallback_sentiment_analysis(articles)
                 
         except Exception as e:
@@ -1,15 +1,21 @@
 # Flask API for Space Biology Knowledge Engine
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
-import json
+import orjson
 from sentence_transformers import SentenceTransformer
 import chromadb
+import numpy as np
 from typing import Dict, List
 from collections import Counter, defaultdict
 import os
+import re
+import mmap
+import hashlib
+import threading
 from knowledge_graph import BioscienceKnowledgeGraph
 from ai_services import GroqAIService
+from text_utils import count_keywords
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -18,9 +24,42 @@ CORS(app)  # Enable CORS for Next.js frontend
 
 # Configuration
 DATA_FILE = './nasa_articles_scraped_20251004_070858.json'
+CHUNK_SIZE = 500
+CHUNK_STRIDE = 400
+MIN_CHUNK_CHARS = 50
+ENCODE_BATCH_SIZE = 64
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+EMBEDDING_QUANTIZE = os.getenv('EMBEDDING_QUANTIZE', 'true').lower() == 'true'
+# Identifies the vectors a model variant produces; persisted indexes and caches are keyed on it
+EMBEDDING_MODEL_TAG = EMBEDDING_MODEL_NAME + ('-int8' if EMBEDDING_QUANTIZE else '')
+CHROMA_PATH = os.getenv('CHROMA_PATH', './chroma_db')
+EMBEDDING_CACHE_DIR = os.getenv('EMBEDDING_CACHE_DIR', './cache')
+COLLECTION_NAME = "space_biology_articles"
+COLLECTION_METADATA = {"description": "NASA space biology research"}
+
+# Browser/proxy cache lifetime for the pre-rendered /api/stats and /api/summary
+STATIC_RESPONSE_MAX_AGE = 300
+
+# Common space biology terms counted by /api/summary
+SUMMARY_KEYWORDS = (
+    'microgravity', 'spaceflight', 'radiation', 'bone', 'muscle',
+    'gene', 'cell', 'protein', 'mice', 'expression', 'tissue',
+    'astronaut', 'iss', 'space', 'atrophy', 'metabolism'
+)
+
+# Entity extraction patterns for /api/extract/entities
+_GENE_RE = re.compile(r'\b[A-Z][A-Z0-9]{2,9}\b')
+_MEASUREMENT_RE = re.compile(r'\d+\.?\d*\s*(?:mm|cm|m|g|kg|mg|\u00b5m|\u03bcm|nm|Gy|cGy|%)')
+_ORGANISMS = ('mice', 'mouse', 'human', 'drosophila', 'arabidopsis', 'cells')
 
 # Global variables
 articles_data = []
+articles_by_id = {}
+search_blobs = []  # lowercased title + results text, aligned with articles_data; also the graph's extraction input
+summary_blobs = []  # lowercased title + results_summary, aligned with articles_data (question matching)
+articles_with_results = 0  # count of articles_data entries with has_results
+summary_keyword_counts = {}  # SUMMARY_KEYWORDS counted over titles + summaries
+static_responses = {}  # endpoint name -> (pre-rendered JSON body, ETag)
 embedding_model = None
 chroma_client = None
 collection = None
@@ -29,35 +68,97 @@ relationship_stats = {}
 knowledge_graph = None
 ai_service = None
 
-def initialize():
-    """Initialize models and load data"""
-    global articles_data, embedding_model, chroma_client, collection, entity_stats, relationship_stats, knowledge_graph, ai_service
+# Models and external services are loaded on first use, each under its own
+# lock so a slow loader (e.g. a Neo4j graph build) doesn't hold up the others.
+# Loaders that call each other only ever take a different lock, so plain Locks suffice.
+_embedding_lock = threading.Lock()
+_chroma_lock = threading.Lock()
+_collection_lock = threading.Lock()
+_graph_lock = threading.Lock()
+_ai_service_lock = threading.Lock()
+_knowledge_graph_loaded = False
+_ai_service_loaded = False
+
+def load_data():
+    """Load articles and derived indexes; models and services load lazily on first use"""
+    global articles_data
     
     print("Initializing API server...")
     
     # Load articles data
-    with open(DATA_FILE, 'r', encoding='utf-8') as f:
-        articles_data = json.load(f)
+    articles_data = load_articles(DATA_FILE)
     
+    build_article_indexes()
     print(f"✓ Loaded {len(articles_data)} articles")
+    print("✓ API server ready!")
+
+def get_embedding_model() -> SentenceTransformer:
+    """Load the embedding model on first use"""
+    global embedding_model
     
-    # Load embedding model
-    embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    print("✓ Loaded embedding model")
+    if embedding_model is None:
+        with _embedding_lock:
+            if embedding_model is None:
+                if EMBEDDING_QUANTIZE:
+                    # int8 weights for the Linear layers: ~4x smaller and faster on CPU.
+                    # Dynamic quantized layers only run on CPU, so pin the model there
+                    import torch
+                    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device='cpu')
+                    transformer = model[0]
+                    transformer.auto_model = torch.quantization.quantize_dynamic(
+                        transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                else:
+                    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+                # Published only once final, so no caller encodes with fp32 weights
+                # under the int8 tag
+                embedding_model = model
+                print(f"✓ Loaded embedding model ({EMBEDDING_MODEL_TAG})")
+    return embedding_model
+
+def get_chroma_client():
+    """Open the persistent ChromaDB client on first use"""
+    global chroma_client
     
-    # Initialize ChromaDB
-    chroma_client = chromadb.Client()
-    collection = chroma_client.create_collection(
-        name="space_biology_articles",
-        metadata={"description": "NASA space biology research"}
-    )
+    if chroma_client is None:
+        with _chroma_lock:
+            if chroma_client is None:
+                chroma_client = chromadb.PersistentClient(path=CHROMA_PATH)
+    return chroma_client
+
+def get_collection():
+    """Open the article collection on first use, indexing articles if the stored index is stale"""
+    global collection
     
-    # Index articles
-    index_articles()
+    if collection is None:
+        with _collection_lock:
+            if collection is None:
+                opened = get_chroma_client().get_or_create_collection(
+                    name=COLLECTION_NAME,
+                    metadata=COLLECTION_METADATA
+                )
+                # Index articles (skipped when the stored index matches the data file).
+                # Published only once indexed, so unlocked readers never see a partial
+                # collection and a failed index is retried on the next request
+                collection = index_articles(opened)
+    return collection
+
+def get_graph():
+    """Connect to the Neo4j knowledge graph on first use; None if unavailable"""
+    global knowledge_graph, _knowledge_graph_loaded
     
+    if not _knowledge_graph_loaded:
+        with _graph_lock:
+            if not _knowledge_graph_loaded:
+                knowledge_graph = connect_knowledge_graph()
+                _knowledge_graph_loaded = True
+    return knowledge_graph
+
+def connect_knowledge_graph():
+    """Connect to Neo4j and make sure the graph is built and has importance scores"""
     # Initialize Neo4j Knowledge Graph (remote-only via env)
     try:
-        knowledge_graph = BioscienceKnowledgeGraph(embedding_model)
+        knowledge_graph = BioscienceKnowledgeGraph()
         print("✓ Connected to Neo4j knowledge graph")
         
         # Build graph from articles JSON into Neo4j only if empty, or if no importances found
@@ -75,36 +176,165 @@ def initialize():
                         gd2 = knowledge_graph.get_graph_data()
                         if (gd2.get('stats', {}).get('total_nodes') or 0) == 0:
                             print("ℹ️ Graph still empty for visualization; rebuilding from articles...")
-                            stats = knowledge_graph.build_graph(articles_data)
+                            stats = knowledge_graph.build_graph(articles_data, search_blobs)
                             print(f"✓ Rebuilt knowledge graph: nodes={stats.get('nodes', 0)}, edges={stats.get('edges', 0)}")
                 except Exception as ie:
                     print(f"⚠️ Graph data check failed: {ie}")
             else:
-                stats = knowledge_graph.build_graph(articles_data)
+                stats = knowledge_graph.build_graph(articles_data, search_blobs)
                 print(f"✓ Knowledge graph built remotely: nodes={stats.get('nodes', 0)}, edges={stats.get('edges', 0)}")
         except Exception as e:
             print(f"⚠️ Failed to verify/build knowledge graph: {e}")
+        return knowledge_graph
     except Exception as e:
         print(f"⚠️ Knowledge graph initialization failed: {e}")
-        
+        return None
+
+def get_ai_service():
+    """Create the AI service on first use; None without a Groq API key"""
+    global ai_service, _ai_service_loaded
     
-    # Initialize AI Service (with placeholder API key)
-    groq_api_key = os.getenv('GROQ_API_KEY', 'your-groq-api-key-here')
-    if groq_api_key != 'your-groq-api-key-here':
-        ai_service = GroqAIService(groq_api_key)
-        print("✓ Initialized AI service")
-    else:
-        print("⚠️ Groq API key not set - AI features will be limited")
-        ai_service = None
+    if not _ai_service_loaded:
+        with _ai_service_lock:
+            if not _ai_service_loaded:
+                # Initialize AI Service (with placeholder API key)
+                groq_api_key = os.getenv('GROQ_API_KEY', 'your-groq-api-key-here')
+                if groq_api_key != 'your-groq-api-key-here':
+                    ai_service = GroqAIService(
+                        groq_api_key,
+                        embedding_model=get_embedding_model(),
+                        chroma_client=get_chroma_client(),
+                        embedding_model_tag=EMBEDDING_MODEL_TAG
+                    )
+                    print("✓ Initialized AI service")
+                else:
+                    print("⚠️ Groq API key not set - AI features will be limited")
+                    ai_service = None
+                _ai_service_loaded = True
+    return ai_service
+
+def graph_top_entities(n: int = 20) -> List[Dict]:
+    """Top knowledge-graph entities, or [] when the graph is unavailable"""
+    knowledge_graph = get_graph()
+    return knowledge_graph.get_top_entities(n) if knowledge_graph else []
+
+def scan_entity_articles(entity_name: str, limit: int = 10) -> Dict:
+    """Fallback for the graph lookup: substring-match the entity against the cached search blobs"""
+    needle = entity_name.lower()
+    related = [
+        a for a, blob in zip(articles_data, search_blobs)
+        if a.get('has_results') and needle in blob
+    ]
+    return {
+        'related_articles': [
+            {'article_id': a['article_id'], 'title': a['title'], 'link': a['link']}
+            for a in related[:limit]
+        ],
+        'total_articles': len(related),
+    }
+
+def load_articles(path: str) -> List[Dict]:
+    """Parse the articles file straight from a read-only memory map (no read buffer copy)"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def build_article_indexes():
+    """Rebuild lookup structures derived from articles_data; call whenever it changes"""
+    global articles_by_id, search_blobs, summary_blobs, summary_keyword_counts, articles_with_results
     
-    print("✓ API server ready!")
+    articles_by_id = {a['article_id']: a for a in articles_data}
+    articles_with_results = sum(1 for a in articles_data if a.get('has_results'))
+    search_blobs = [
+        f"{a.get('title', '')} {a.get('results_full', '')} {a.get('results_summary', '')}".lower()
+        for a in articles_data
+    ]
+    summary_blobs = [
+        f"{a.get('title', '')} {a.get('results_summary', '')}".lower()
+        for a in articles_data
+    ]
+    # The corpus is static between loads, so the summary keywords are counted
+    # once here rather than rescanning the joined text on every request
+    summary_corpus = ' '.join([
+        blob for a, blob in zip(articles_data, summary_blobs) if a.get('has_results')
+    ])
+    summary_keyword_counts = count_keywords(summary_corpus, SUMMARY_KEYWORDS)
+    
+    render_static_responses()
 
-def index_articles():
-    """Index all articles into ChromaDB"""
+def render_static_responses():
+    """Pre-render the JSON bodies of endpoints that only depend on articles_data"""
+    global static_responses
+    
+    sorted_keywords = sorted(
+        summary_keyword_counts.items(),
+        key=lambda x: x[1],
+        reverse=True
+    )
+    
+    bodies = {
+        'stats': {
+            'total_articles': len(articles_data),
+            'articles_with_results': articles_with_results,
+            'articles_without_results': len(articles_data) - articles_with_results
+        },
+        'summary': {
+            'total_articles': len(articles_data),
+            'articles_with_results': articles_with_results,
+            'top_keywords': sorted_keywords[:15]
+        }
+    }
+    
+    static_responses = {}
+    for name, payload in bodies.items():
+        body = orjson.dumps(payload)
+        static_responses[name] = (body, hashlib.sha256(body).hexdigest())
+
+def static_json_response(name: str):
+    """Serve a pre-rendered body with caching headers, answering 304 when the ETag matches"""
+    body, etag = static_responses[name]
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_RESPONSE_MAX_AGE}'
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def load_embedding_cache() -> Dict[str, np.ndarray]:
+    """Load cached chunk embeddings as {sha256(chunk text): vector}"""
+    vectors_path = os.path.join(EMBEDDING_CACHE_DIR, EMBEDDING_MODEL_TAG, 'embeddings.npy')
+    ids_path = os.path.join(EMBEDDING_CACHE_DIR, EMBEDDING_MODEL_TAG, 'ids.json')
+    if not (os.path.exists(vectors_path) and os.path.exists(ids_path)):
+        return {}
+    
+    try:
+        vectors = np.load(vectors_path)
+        with open(ids_path, 'rb') as f:
+            hashes = orjson.loads(f.read())
+        if len(hashes) != len(vectors):
+            return {}
+        return dict(zip(hashes, vectors))
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable embedding cache: {e}")
+        return {}
+
+def save_embedding_cache(embeddings: Dict[str, np.ndarray]):
+    """Persist chunk embeddings (one row per hash) for reuse on the next run"""
+    if not embeddings:
+        return
+    
+    cache_dir = os.path.join(EMBEDDING_CACHE_DIR, EMBEDDING_MODEL_TAG)
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(os.path.join(cache_dir, 'embeddings.npy'), np.vstack(list(embeddings.values())))
+    with open(os.path.join(cache_dir, 'ids.json'), 'wb') as f:
+        f.write(orjson.dumps(list(embeddings.keys())))
+
+def index_articles(collection):
+    """Index all articles into a ChromaDB collection, reusing the persisted index when it is current.
+    Returns the collection holding the index (a new one if the stale index was dropped).
+    """
     global entity_stats, relationship_stats
     
     print("Indexing articles...")
-    doc_id = 0
+    docs, ids, metadatas = [], [], []
     
     for article in articles_data:
         if not article.get('has_results'):
@@ -114,37 +344,90 @@ def index_articles():
         texts_to_index = []
         
         if article.get('results_full'):
-            # Split into chunks (max 500 chars each)
+            # Split into CHUNK_SIZE-char windows advancing by CHUNK_STRIDE, so
+            # consecutive chunks overlap by 100 chars and no sentence is only
+            # ever seen cut in half
             full_text = article['results_full']
-            chunks = [full_text[i:i+500] for i in range(0, len(full_text), 400)]
+            chunks = [full_text[i:i+CHUNK_SIZE] for i in range(0, len(full_text), CHUNK_STRIDE)]
             texts_to_index.extend(chunks)
         
         if article.get('results_summary'):
             texts_to_index.append(article['results_summary'])
         
-        # Generate embeddings and store
         for text in texts_to_index:
-            if len(text.strip()) < 50:
+            if len(text.strip()) < MIN_CHUNK_CHARS:
                 continue
-                
-            doc_id += 1
-            embedding = embedding_model.encode(text).tolist()
             
-            collection.add(
-                documents=[text],
-                embeddings=[embedding],
-                ids=[f"doc_{doc_id}"],
-                metadatas=[{
-                    'article_id': article['article_id'],
-                    'title': article['title'][:100],
-                    'link': article['link']
-                }]
-            )
-    
-    print(f"✓ Indexed {doc_id} document chunks")
-
-# Initialize on startup
-initialize()
+            docs.append(text)
+            ids.append(f"doc_{len(docs)}")
+            metadatas.append({
+                'article_id': article['article_id'],
+                'title': article['title'][:100],
+                'link': article['link']
+            })
+    
+    # The collection metadata records which data file and chunk count it was built from
+    manifest = {
+        **COLLECTION_METADATA,
+        'data_file_mtime': os.path.getmtime(DATA_FILE),
+        'chunk_count': len(docs),
+        'embedding_model': EMBEDDING_MODEL_TAG
+    }
+    existing = collection.metadata or {}
+    if (existing.get('data_file_mtime') == manifest['data_file_mtime']
+            and existing.get('embedding_model') == EMBEDDING_MODEL_TAG
+            and existing.get('chunk_count') == len(docs)
+            and collection.count() == len(docs)):
+        print(f"✓ ChromaDB index is current ({len(docs)} document chunks), skipping indexing")
+        return collection
+    
+    if collection.count() > 0:
+        print("ℹ️ ChromaDB index is stale; rebuilding...")
+        client = get_chroma_client()
+        client.delete_collection(COLLECTION_NAME)
+        collection = client.create_collection(name=COLLECTION_NAME, metadata=COLLECTION_METADATA)
+    
+    if not docs:
+        print("✓ Indexed 0 document chunks")
+        return collection
+    
+    # Encode each distinct chunk once, reusing vectors cached from earlier runs
+    doc_hashes = [hashlib.sha256(text.encode('utf-8')).hexdigest() for text in docs]
+    unique_texts = dict(zip(doc_hashes, docs))
+    cached = load_embedding_cache()
+    missing = [h for h in unique_texts if h not in cached]
+    
+    if missing:
+        new_embeddings = get_embedding_model().encode(
+            [unique_texts[h] for h in missing],
+            batch_size=ENCODE_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        cached.update(zip(missing, new_embeddings))
+    
+    embedding_by_hash = {h: cached[h] for h in unique_texts}
+    save_embedding_cache(embedding_by_hash)
+    
+    collection.add(
+        documents=docs,
+        embeddings=[embedding_by_hash[h].tolist() for h in doc_hashes],
+        ids=ids,
+        metadatas=metadatas
+    )
+    collection.modify(metadata=manifest)
+    
+    print(f"✓ Indexed {len(docs)} document chunks ({len(missing)} newly embedded, "
+          f"{len(unique_texts) - len(missing)} from cache)")
+    return collection
+
+# Load data on startup; models and services load on first request that needs them
+load_data()
+
+def ojsonify(obj) -> Response:
+    """jsonify replacement serializing with orjson straight to bytes"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
 
 # ============================================================================
 # API ROUTES
@@ -153,7 +436,7 @@ initialize()
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         'status': 'healthy',
         'message': 'API is running',
         'total_articles': len(articles_data)
@@ -162,13 +445,7 @@ def health_check():
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get knowledge base statistics"""
-    articles_with_results = len([a for a in articles_data if a.get('has_results')])
-    
-    return jsonify({
-        'total_articles': len(articles_data),
-        'articles_with_results': articles_with_results,
-        'articles_without_results': len(articles_data) - articles_with_results
-    })
+    return static_json_response('stats')
 
 @app.route('/api/articles', methods=['GET'])
 def get_articles():
@@ -185,7 +462,7 @@ def get_articles():
     start = (page - 1) * per_page
     end = start + per_page
     
-    return jsonify({
+    return ojsonify({
         'articles': filtered[start:end],
         'total': len(filtered),
         'page': page,
@@ -196,12 +473,12 @@ def get_articles():
 @app.route('/api/article/<article_id>', methods=['GET'])
 def get_article(article_id):
     """Get single article by ID"""
-    article = next((a for a in articles_data if a['article_id'] == article_id), None)
+    article = articles_by_id.get(article_id)
     
     if article:
-        return jsonify(article)
+        return ojsonify(article)
     else:
-        return jsonify({'error': 'Article not found'}), 404
+        return ojsonify({'error': 'Article not found'}), 404
 
 @app.route('/api/search', methods=['POST'])
 def semantic_search():
@@ -215,45 +492,48 @@ def semantic_search():
         top_k = data.get('top_k', 10)
         
         if not query:
-            return jsonify({'error': 'Query is required'}), 400
+            return ojsonify({'error': 'Query is required'}), 400
         
         # Generate query embedding
-        query_embedding = embedding_model.encode(query).tolist()
+        query_embedding = get_embedding_model().encode(query, normalize_embeddings=True).tolist()
         
         # Search
-        results = collection.query(
+        results = get_collection().query(
             query_embeddings=[query_embedding],
             n_results=min(top_k, 50)
         )
         
-        # Format results
-        formatted_results = []
-        seen_articles = set()
+        # Format results: keep the best-ranked chunk per article (np.unique
+        # gives each id's first index; sorting restores rank order)
+        documents = results['documents'][0]
+        article_ids = [m['article_id'] for m in results['metadatas'][0]]
+        distances = results.get('distances')
+        similarities = (1 - np.asarray(distances[0])).tolist() if distances else None
         
-        for idx in range(len(results['documents'][0])):
-            article_id = results['metadatas'][0][idx]['article_id']
-            
-            # Get full article
-            article = next((a for a in articles_data if a['article_id'] == article_id), None)
-            
-            if article and article_id not in seen_articles:
-                seen_articles.add(article_id)
+        _, first_idx = np.unique(np.array(article_ids), return_index=True)
+        first_idx.sort()
+        
+        formatted_results = []
+        for idx in first_idx.tolist():
+            article_id = article_ids[idx]
+            article = articles_by_id.get(article_id)
+            if article:
                 formatted_results.append({
                     'article_id': article_id,
                     'title': article['title'],
                     'link': article['link'],
-                    'matched_text': results['documents'][0][idx],
-                    'similarity': 1 - results['distances'][0][idx] if 'distances' in results else None
+                    'matched_text': documents[idx],
+                    'similarity': similarities[idx] if similarities else None
                 })
         
-        return jsonify({
+        return ojsonify({
             'query': query,
             'results': formatted_results,
             'total': len(formatted_results)
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/search/keywords', methods=['POST'])
 def keyword_search():
@@ -267,23 +547,17 @@ def keyword_search():
         match_all = data.get('match_all', False)
         
         if not keywords:
-            return jsonify({'error': 'Keywords are required'}), 400
+            return ojsonify({'error': 'Keywords are required'}), 400
         
         results = []
+        keywords_lower = [kw.lower() for kw in keywords]
         
-        for article in articles_data:
+        for article, searchable_text in zip(articles_data, search_blobs):
             if not article.get('has_results'):
                 continue
             
-            # Search in title and results
-            searchable_text = (
-                article.get('title', '') + ' ' +
-                article.get('results_full', '') + ' ' +
-                article.get('results_summary', '')
-            ).lower()
-            
-            # Check keyword matches
-            matches = [kw.lower() in searchable_text for kw in keywords]
+            # Check keyword matches against the precomputed title + results text
+            matches = [kw in searchable_text for kw in keywords_lower]
             
             if match_all:
                 if all(matches):
@@ -303,7 +577,7 @@ def keyword_search():
                         'matched_keywords': matched
                     })
         
-        return jsonify({
+        return ojsonify({
             'keywords': keywords,
             'match_all': match_all,
             'results': results,
@@ -311,7 +585,7 @@ def keyword_search():
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/extract/entities', methods=['POST'])
 def extract_entities_from_text():
@@ -320,74 +594,36 @@ def extract_entities_from_text():
     Body: { "text": "your text here" }
     """
     try:
-        import re
-        
         data = request.json
         text = data.get('text', '')
         
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return ojsonify({'error': 'Text is required'}), 400
         
         # Extract genes/proteins (uppercase acronyms)
-        genes = re.findall(r'\b[A-Z][A-Z0-9]{2,9}\b', text)
+        genes = set(_GENE_RE.findall(text))
         
         # Extract numbers with units (measurements)
-        measurements = re.findall(r'\d+\.?\d*\s*(?:mm|cm|m|g|kg|mg|Î¼m|nm|Gy|cGy|%)', text)
+        measurements = set(_MEASUREMENT_RE.findall(text))
         
         # Extract organisms
-        organisms = []
-        organism_patterns = ['mice', 'mouse', 'human', 'drosophila', 'arabidopsis', 'cells']
-        for pattern in organism_patterns:
-            if pattern in text.lower():
-                organisms.append(pattern)
-        
-        return jsonify({
-            'genes_proteins': list(set(genes)),
-            'measurements': list(set(measurements)),
-            'organisms': list(set(organisms)),
+        text_lower = text.lower()
+        organisms = [o for o in _ORGANISMS if o in text_lower]
+        
+        return ojsonify({
+            'genes_proteins': list(genes),
+            'measurements': list(measurements),
+            'organisms': organisms,
             'text_length': len(text)
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/summary', methods=['GET'])
 def get_summary():
     """Get summary of all articles"""
-    try:
-        # Keywords frequency
-        all_text = ' '.join([
-            a.get('title', '') + ' ' + 
-            a.get('results_summary', '')
-            for a in articles_data if a.get('has_results')
-        ]).lower()
-        
-        # Common space biology terms
-        keywords_to_count = [
-            'microgravity', 'spaceflight', 'radiation', 'bone', 'muscle',
-            'gene', 'cell', 'protein', 'mice', 'expression', 'tissue',
-            'astronaut', 'iss', 'space', 'atrophy', 'metabolism'
-        ]
-        
-        keyword_counts = {
-            kw: all_text.count(kw) for kw in keywords_to_count
-        }
-        
-        # Sort by frequency
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        return jsonify({
-            'total_articles': len(articles_data),
-            'articles_with_results': len([a for a in articles_data if a.get('has_results')]),
-            'top_keywords': sorted_keywords[:15]
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return static_json_response('summary')
 
 # ============================================================================
 # KNOWLEDGE GRAPH ENDPOINTS
@@ -397,8 +633,9 @@ def get_summary():
 def get_knowledge_graph():
     """Get the complete knowledge graph data"""
     try:
+        knowledge_graph = get_graph()
         if not knowledge_graph:
-            return jsonify({'error': 'Knowledge graph not initialized'}), 500
+            return ojsonify({'error': 'Knowledge graph not initialized'}), 500
         
         graph_data = knowledge_graph.get_graph_data()
         # Self-heal: if empty, try recalculating importance/relationships and rebuild if needed
@@ -411,7 +648,7 @@ def get_knowledge_graph():
                 pass
         if (graph_data.get('stats', {}).get('total_nodes') or 0) == 0:
             try:
-                stats = knowledge_graph.build_graph(articles_data)
+                stats = knowledge_graph.build_graph(articles_data, search_blobs)
                 graph_data = knowledge_graph.get_graph_data()
                 print(f"ℹ️ Graph rebuilt via API request: nodes={stats.get('nodes', 0)}, edges={stats.get('edges', 0)}")
             except Exception as e:
@@ -419,7 +656,7 @@ def get_knowledge_graph():
 
         top_entities = knowledge_graph.get_top_entities(20)
         
-        return jsonify({
+        return ojsonify({
             'graph': graph_data,
             'top_entities': top_entities,
             'stats': {
@@ -430,55 +667,57 @@ def get_knowledge_graph():
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/knowledge-graph/entity/<entity_name>', methods=['GET'])
 def get_entity_details(entity_name):
     """Get details and relationships for a specific entity"""
     try:
+        knowledge_graph = get_graph()
         if not knowledge_graph:
-            return jsonify({'error': 'Knowledge graph not initialized'}), 500
+            return ojsonify({'error': 'Knowledge graph not initialized'}), 500
         
-        relationships = knowledge_graph.get_entity_relationships(entity_name)
+        # Entity nodes are stored stripped and lowercased
+        entity_key = entity_name.strip().lower()
+        relationships = knowledge_graph.get_entity_relationships(entity_key)
         
-        # Get articles mentioning this entity
-        related_articles = []
-        for article in articles_data:
-            if article.get('has_results'):
-                text = f"{article.get('title', '')} {article.get('results_full', '')} {article.get('results_summary', '')}"
-                if entity_name.lower() in text.lower():
-                    related_articles.append({
-                        'article_id': article['article_id'],
-                        'title': article['title'],
-                        'link': article['link']
-                    })
+        # Articles are linked to the entity by MENTIONS edges in the graph
+        try:
+            articles = knowledge_graph.get_entity_articles(entity_key, limit=10)
+            if not articles['total_articles']:
+                # Not an extracted entity: match the name in the article text index
+                articles = knowledge_graph.search_article_text(entity_key, limit=10)
+        except Exception as e:
+            print(f"⚠️ Entity article lookup failed, scanning articles instead: {e}")
+            articles = scan_entity_articles(entity_key, limit=10)
         
-        return jsonify({
+        return ojsonify({
             'entity': entity_name,
             'relationships': relationships,
-            'related_articles': related_articles[:10],  # Limit to 10 articles
-            'total_articles': len(related_articles)
+            'related_articles': articles['related_articles'],
+            'total_articles': articles['total_articles']
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/knowledge-graph/communities', methods=['GET'])
 def get_communities():
     """Get community/cluster information from the knowledge graph"""
     try:
+        knowledge_graph = get_graph()
         if not knowledge_graph:
-            return jsonify({'error': 'Knowledge graph not initialized'}), 500
+            return ojsonify({'error': 'Knowledge graph not initialized'}), 500
         
         communities = knowledge_graph.find_communities()
         
-        return jsonify({
+        return ojsonify({
             'communities': communities,
             'total_communities': len(communities)
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 # ============================================================================
 # AI ENDPOINTS
@@ -488,93 +727,139 @@ def get_communities():
 def ai_summarize_article():
     """Generate AI summary for an article"""
     try:
+        ai_service = get_ai_service()
         if not ai_service:
-            return jsonify({'error': 'AI service not available'}), 503
+            return ojsonify({'error': 'AI service not available'}), 503
         
         data = request.json
         article_id = data.get('article_id')
-        
+        article_ids = data.get('article_ids')
+
+        # Batch mode: several articles summarized per Groq call
+        if article_ids:
+            articles = [
+                articles_by_id[aid] for aid in dict.fromkeys(article_ids)
+                if aid in articles_by_id
+            ]
+            if not articles:
+                return ojsonify({'error': 'Articles not found'}), 404
+
+            summaries = ai_service.summarize_articles_batch(articles)
+            return ojsonify({'summaries': summaries, 'total': len(summaries)})
+
         if not article_id:
-            return jsonify({'error': 'article_id is required'}), 400
+            return ojsonify({'error': 'article_id or article_ids is required'}), 400
         
         # Find article
-        article = next((a for a in articles_data if a['article_id'] == article_id), None)
+        article = articles_by_id.get(article_id)
         if not article:
-            return jsonify({'error': 'Article not found'}), 404
+            return ojsonify({'error': 'Article not found'}), 404
         
         summary = ai_service.summarize_article(article)
-        return jsonify(summary)
+        return ojsonify(summary)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/topics', methods=['GET'])
 def ai_generate_topics():
     """Generate AI-powered topic clusters"""
     try:
+        ai_service = get_ai_service()
         if not ai_service:
-            return jsonify({'error': 'AI service not available'}), 503
+            return ojsonify({'error': 'AI service not available'}), 503
         
         topics = ai_service.generate_topic_clusters(articles_data)
-        return jsonify(topics)
+        return ojsonify(topics)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/insights', methods=['GET'])
 def ai_generate_insights():
     """Generate AI insights about the research corpus"""
     try:
+        ai_service = get_ai_service()
         if not ai_service:
-            return jsonify({'error': 'AI service not available'}), 503
+            return ojsonify({'error': 'AI service not available'}), 503
         
         # Get knowledge graph data
         graph_data = {
-            'top_entities': knowledge_graph.get_top_entities(20) if knowledge_graph else []
+            'top_entities': graph_top_entities(20)
         }
         
         insights = ai_service.generate_insights(articles_data, graph_data)
-        return jsonify(insights)
+        return ojsonify(insights)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/ai/ask', methods=['POST'])
 def ai_ask_question():
     """Answer questions about the research corpus"""
     try:
+        ai_service = get_ai_service()
         if not ai_service:
-            return jsonify({'error': 'AI service not available'}), 503
+            return ojsonify({'error': 'AI service not available'}), 503
         
         data = request.json
         question = data.get('question', '')
         
         if not question:
-            return jsonify({'error': 'question is required'}), 400
+            return ojsonify({'error': 'question is required'}), 400
         
         # Get knowledge graph data
         graph_data = {
-            'top_entities': knowledge_graph.get_top_entities(20) if knowledge_graph else []
+            'top_entities': graph_top_entities(20)
         }
         
-        answer = ai_service.answer_question(question, articles_data, graph_data)
-        return jsonify(answer)
+        answer = ai_service.answer_question(question, articles_data, graph_data, search_texts=summary_blobs)
+        return ojsonify(answer)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
+
+@app.route('/api/ai/ask/stream', methods=['POST'])
+def ai_ask_question_stream():
+    """Stream an answer as server-sent events"""
+    try:
+        ai_service = get_ai_service()
+        if not ai_service:
+            return ojsonify({'error': 'AI service not available'}), 503
+        
+        data = request.json
+        question = data.get('question', '')
+        
+        if not question:
+            return ojsonify({'error': 'question is required'}), 400
+        
+        graph_data = {
+            'top_entities': graph_top_entities(20)
+        }
+    
+    except Exception as e:
+        return ojsonify({'error': str(e)}), 500
+    
+    # Errors after this point are reported in-stream by answer_question_stream
+    def generate():
+        for event in ai_service.answer_question_stream(question, articles_data, graph_data, search_texts=summary_blobs):
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
 @app.route('/api/ai/sentiment', methods=['GET'])
 def ai_sentiment_analysis():
     """Analyze sentiment of research outcomes"""
     try:
+        ai_service = get_ai_service()
         if not ai_service:
-            return jsonify({'error': 'AI service not available'}), 503
+            return ojsonify({'error': 'AI service not available'}), 503
         
         sentiment = ai_service.generate_sentiment_analysis(articles_data)
-        return jsonify(sentiment)
+        return ojsonify(sentiment)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 # ============================================================================
 # DASHBOARD ANALYTICS ENDPOINTS
@@ -584,11 +869,9 @@ def ai_sentiment_analysis():
 def get_dashboard_overview():
     """Get comprehensive dashboard overview data"""
     try:
-        # Basic stats
-        articles_with_results = len([a for a in articles_data if a.get('has_results')])
-        
         # Knowledge graph stats
         graph_stats = {}
+        knowledge_graph = get_graph()
         if knowledge_graph:
             graph_data = knowledge_graph.get_graph_data()
             graph_stats = {
@@ -599,14 +882,15 @@ def get_dashboard_overview():
         
         # AI insights (if available)
         ai_insights = {}
+        ai_service = get_ai_service()
         if ai_service:
             try:
-                graph_data = {'top_entities': knowledge_graph.get_top_entities(20) if knowledge_graph else []}
+                graph_data = {'top_entities': graph_top_entities(20)}
                 ai_insights = ai_service.generate_insights(articles_data, graph_data)
             except:
                 ai_insights = {'error': 'AI insights unavailable'}
         
-        return jsonify({
+        return ojsonify({
             'basic_stats': {
                 'total_articles': len(articles_data),
                 'articles_with_results': articles_with_results,
@@ -618,7 +902,7 @@ def get_dashboard_overview():
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
     print("Starting API server...")
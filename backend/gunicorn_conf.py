@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for serving the Flask API with gevent workers
+Run from backend/: gunicorn -c gunicorn_conf.py app:app
+
+The gevent worker monkey-patches sockets before it imports app.py, so
+Groq, ChromaDB and Neo4j I/O from concurrent requests overlaps instead
+of blocking the worker. CPU-bound work is not overlapped: the first
+requests that load the embedding model, embed the articles or extract
+graph entities hold the worker (including /api/health) until they finish.
+"""
+
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+worker_class = 'gevent'
+# One worker by default: each worker would index into the shared ./chroma_db
+# (not safe across processes) and may rebuild the Neo4j graph, which starts
+# by deleting it. gevent gives the concurrency within that worker.
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+worker_connections = 1000
+# Groq calls and graph rebuilds can take well over the 30s default
+timeout = 120
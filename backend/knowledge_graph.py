@@ -4,17 +4,288 @@ Optimized for cloud deployment with minimal dependencies
 """
 
 from neo4j import GraphDatabase
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
 import json
 import re
 from typing import Dict, List, Tuple
 import os
+import time
+import uuid
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from text_utils import WordMatcher
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Graph build settings
+ARTICLE_BATCH_SIZE = 500
+ROW_BATCH_SIZE = 5000  # entity and MENTIONS rows per UNWIND
+GRAPH_WRITE_CONCURRENCY = 16  # in-flight write transactions during a build
+GRAPH_NODE_LIMIT = 150
+READ_FETCH_SIZE = 1000  # records pulled per round-trip when streaming reads
+EXTRACT_CHUNKSIZE = 32
+# Extraction costs ~0.5 ms per article in-process, while each spawned worker
+# re-imports the main module (under `python app.py` that means torch, chromadb
+# and reparsing the articles file: seconds per worker). The pool only pays off
+# for corpora in the tens of thousands of uncached texts; below that, extract
+# in-process. The current corpus (~50 articles with results) never uses it.
+EXTRACT_PARALLEL_MIN = 20000
+EXTRACT_CACHE_SIZE = 4096  # texts whose extracted entities are kept across rebuilds
+GRAPH_CACHE_TTL = 60  # seconds; the cache is also dropped whenever the graph changes
+
+# Simple entity patterns (no spaCy needed)
+ENTITY_PATTERNS = {
+    'genes_proteins': [
+        r'\b[A-Z][A-Z0-9]{2,9}\b',  # Gene symbols
+        r'\b(?:protein|gene|mRNA|DNA|RNA)\b',  # Common terms
+    ],
+    'measurements': [
+        r'\d+\.?\d*\s*(?:mm|cm|m|g|kg|mg|μm|nm|Gy|cGy|%)',
+    ],
+}
+
+# Closed word lists, matched as whole words in one Aho-Corasick pass
+ENTITY_VOCABULARIES = {
+    'organisms': ['mice', 'mouse', 'human', 'drosophila', 'arabidopsis', 'rat', 'zebrafish', 'cell', 'cells'],
+    'conditions': ['microgravity', 'spaceflight', 'radiation', 'hypoxia', 'hypergravity', 'control', 'treatment'],
+    'processes': ['expression', 'transcription', 'metabolism', 'apoptosis', 'differentiation', 'proliferation'],
+}
+
+# Compile once: one case-insensitive alternation per entity type, so
+# each text is scanned once per type
+_COMPILED_PATTERNS = {
+    entity_type: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for entity_type, patterns in ENTITY_PATTERNS.items()
+}
+_VOCABULARY_TYPES = {
+    word: entity_type
+    for entity_type, words in ENTITY_VOCABULARIES.items()
+    for word in words
+}
+_VOCABULARY_MATCHER = WordMatcher(_VOCABULARY_TYPES)
+
+
+def extract_entities_fast(text: str) -> Dict[str, List[str]]:
+    """Fast entity extraction using only regex patterns (picklable for process pools)"""
+    entities = defaultdict(list)
+    
+    # Pattern-based extraction only (no spaCy)
+    for entity_type, pattern in _COMPILED_PATTERNS.items():
+        entities[entity_type].extend(pattern.findall(text))
+    
+    for word in _VOCABULARY_MATCHER.find(text.lower()):
+        entities[_VOCABULARY_TYPES[word]].append(word)
+    
+    # Clean and deduplicate
+    for entity_type in entities:
+        entities[entity_type] = list(set([
+            e.strip().lower() for e in entities[entity_type]
+            if len(e.strip()) > 2
+        ]))
+        
+    return dict(entities)
+
+
+# text -> ((entity_type, (names, ...)), ...); an LRU kept in the parent process,
+# since lru_cache entries filled inside pool workers would die with the pool
+_extraction_cache = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+def extract_entities_many(texts: List[str]) -> List[Dict[str, List[str]]]:
+    """Extract entities for many texts, sending only cache misses to a process pool"""
+    frozen = [None] * len(texts)
+    misses = defaultdict(list)
+    with _extraction_cache_lock:
+        for i, text in enumerate(texts):
+            hit = _extraction_cache.get(text)
+            if hit is None:
+                misses[text].append(i)
+            else:
+                _extraction_cache.move_to_end(text)
+                frozen[i] = hit
+    
+    if misses:
+        miss_texts = list(misses)
+        if len(miss_texts) < EXTRACT_PARALLEL_MIN:
+            extracted = [extract_entities_fast(text) for text in miss_texts]
+        else:
+            # CPU-bound extraction across processes (regex holds the GIL). Spawned,
+            # not forked: builds run inside request handlers whose process already
+            # holds driver and torch threads, which a fork can deadlock on. Spawned
+            # workers re-import the main module; see EXTRACT_PARALLEL_MIN for the cost
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(mp_context=context) as executor:
+                extracted = list(executor.map(extract_entities_fast, miss_texts, chunksize=EXTRACT_CHUNKSIZE))
+        
+        with _extraction_cache_lock:
+            for text, entities in zip(miss_texts, extracted):
+                result = tuple((entity_type, tuple(names)) for entity_type, names in entities.items())
+                for i in misses[text]:
+                    frozen[i] = result
+                _extraction_cache[text] = result
+                if len(_extraction_cache) > EXTRACT_CACHE_SIZE:
+                    _extraction_cache.popitem(last=False)
+    
+    return [{entity_type: list(names) for entity_type, names in result} for result in frozen]
+
+
+# Cypher queries are fixed strings with $parameters so Neo4j reuses each cached plan
+CLEAR_GRAPH_CYPHER = "MATCH (n) DETACH DELETE n"
+
+INSERT_ARTICLES_CYPHER = """
+UNWIND $batch AS row
+MERGE (a:Article {article_id: row.article_id})
+SET a.title = row.title,
+    a.link = row.link,
+    a.results_summary = row.results_summary,
+    a.results_full = row.results_full
+"""
+
+# Entities arrive deduplicated with corpus-wide frequencies, so each is merged once
+INSERT_ENTITIES_CYPHER = """
+UNWIND $batch AS ent
+MERGE (e:Entity {name: ent.name})
+SET e.type = ent.type, e.frequency = ent.frequency
+"""
+
+INSERT_MENTIONS_CYPHER = """
+UNWIND $batch AS pair
+MATCH (a:Article {article_id: pair.article_id})
+MATCH (e:Entity {name: pair.name})
+MERGE (a)-[:MENTIONS]->(e)
+"""
+
+# Entity pairs are enumerated inside each article (names sorted so every
+# pair has one orientation), then counted across articles
+BUILD_RELATIONSHIPS_CYPHER = """
+MATCH (a:Article)-[:MENTIONS]->(e:Entity)
+WITH a, collect(e.name) AS names
+UNWIND range(0, size(names) - 2) AS i
+UNWIND range(i + 1, size(names) - 1) AS j
+WITH CASE WHEN names[i] < names[j] THEN names[i] ELSE names[j] END AS name1,
+     CASE WHEN names[i] < names[j] THEN names[j] ELSE names[i] END AS name2
+WITH name1, name2, count(*) AS co_occurrence_count
+WHERE co_occurrence_count >= 2
+MATCH (e1:Entity {name: name1}), (e2:Entity {name: name2})
+MERGE (e1)-[r:CO_OCCURS_WITH]->(e2)
+SET r.weight = toFloat(co_occurrence_count),
+    r.co_occurrence_count = co_occurrence_count,
+    r.shared_articles = co_occurrence_count
+"""
+
+# Degree in one relationship aggregation: the undirected pattern visits each
+# edge once per endpoint. Isolated entities keep the reset value of 0.
+RESET_DEGREE_CYPHER = "MATCH (e:Entity) SET e.degree = 0"
+
+DEGREE_CYPHER = """
+MATCH (a:Entity)-[r:CO_OCCURS_WITH]-(:Entity)
+WITH a, count(r) AS deg
+SET a.degree = deg
+"""
+
+# Importance score (simplified for speed)
+IMPORTANCE_CYPHER = """
+MATCH (e:Entity)
+WITH e, coalesce(e.frequency, 0) AS freq, coalesce(e.degree, 0) AS deg
+SET e.importance = freq * log(toFloat(deg) + 1)
+"""
+
+# Both counts come from the count store, and the directed pattern counts each relationship once
+STATS_CYPHER = """
+CALL { MATCH (n) RETURN count(n) AS total_nodes }
+CALL { MATCH ()-[r]->() RETURN count(r) AS total_edges }
+RETURN total_nodes, total_edges
+"""
+
+TOP_ENTITIES_CYPHER = """
+MATCH (e:Entity)
+WHERE e.importance IS NOT NULL
+RETURN e.name as name, e.importance as importance, 
+       e.frequency as frequency, e.degree as degree
+ORDER BY e.importance DESC
+LIMIT $limit
+"""
+
+ENTITY_RELATIONSHIPS_CYPHER = """
+MATCH (e1:Entity {name: $entity_name})-[r:CO_OCCURS_WITH]-(e2:Entity)
+RETURN e2.name as target, r.weight as weight, 
+       r.co_occurrence_count as co_occurrence_count,
+       r.shared_articles as shared_articles
+ORDER BY r.weight DESC
+LIMIT $limit
+"""
+
+ENTITY_ARTICLES_CYPHER = """
+MATCH (e:Entity {name: $entity_name})
+WITH e, count { (e)<-[:MENTIONS]-(:Article) } AS total_articles
+MATCH (e)<-[:MENTIONS]-(a:Article)
+RETURN a.article_id AS article_id, a.title AS title, a.link AS link, total_articles
+ORDER BY a.article_id
+LIMIT $limit
+"""
+
+# Lucene phrase lookup over article text (the article_text fulltext index)
+ARTICLE_TEXT_SEARCH_CYPHER = """
+CALL db.index.fulltext.queryNodes('article_text', $query) YIELD node, score
+WITH node ORDER BY score DESC
+WITH collect({article_id: node.article_id, title: node.title, link: node.link}) AS hits
+RETURN hits[0..$limit] AS related_articles, size(hits) AS total_articles
+"""
+
+# Top entities by importance plus the edges among them, in one round-trip;
+# CO_OCCURS_WITH is stored once per pair, so the directed match yields each edge once
+GRAPH_DATA_CYPHER = """
+CALL {
+    MATCH (e:Entity)
+    WHERE e.importance IS NOT NULL
+    RETURN e
+    ORDER BY e.importance DESC
+    LIMIT $limit
+}
+WITH collect(e) AS nodes
+CALL {
+    WITH nodes
+    UNWIND nodes AS n1
+    MATCH (n1)-[r:CO_OCCURS_WITH]->(n2:Entity)
+    WHERE n2 IN nodes
+    RETURN collect({source: n1.name, target: n2.name, weight: r.weight,
+                    co_occurrence_count: r.co_occurrence_count}) AS edges
+}
+RETURN [n IN nodes | {id: n.name, importance: n.importance,
+                      frequency: n.frequency, degree: n.degree}] AS nodes,
+       edges
+"""
+
+# Louvain community detection via the Graph Data Science plugin, on a
+# throwaway in-memory projection of the co-occurrence graph
+LOUVAIN_PROJECT_CYPHER = """
+CALL gds.graph.project($graph_name, 'Entity',
+    {CO_OCCURS_WITH: {orientation: 'UNDIRECTED', properties: 'weight'}})
+YIELD graphName
+RETURN graphName
+"""
+
+LOUVAIN_STREAM_CYPHER = """
+CALL gds.louvain.stream($graph_name, {relationshipWeightProperty: 'weight'})
+YIELD nodeId, communityId
+WITH communityId, gds.util.asNode(nodeId) AS e
+RETURN communityId, collect(e.name) AS members
+ORDER BY size(members) DESC
+"""
+
+LOUVAIN_DROP_CYPHER = "CALL gds.graph.drop($graph_name, false) YIELD graphName RETURN graphName"
+
+COMMUNITY_ENTITIES_CYPHER = """
+MATCH (e:Entity)
+WHERE e.importance IS NOT NULL
+RETURN e.name as name, e.type as type, e.degree as degree
+ORDER BY e.importance DESC
+"""
+
 class BioscienceKnowledgeGraph:
     def __init__(self, embedding_model=None, neo4j_uri=None, neo4j_user=None, neo4j_password=None):
         self.embedding_model = embedding_model
@@ -33,24 +304,7 @@ class BioscienceKnowledgeGraph:
         print(f"🔗 Connecting to Neo4j: {self.neo4j_uri}")
         
         # Create driver with proper configuration
-        if self.neo4j_uri.startswith('neo+s://') or self.neo4j_uri.startswith('neo4j+s://'):
-            # Cloud connection (encryption is implied by the URI; do NOT pass encrypted/trust)
-            self.driver = GraphDatabase.driver(
-                self.neo4j_uri,
-                auth=(self.neo4j_user, self.neo4j_password),
-                max_connection_lifetime=30 * 60,
-                max_connection_pool_size=50,
-                connection_acquisition_timeout=2 * 60,
-            )
-        else:
-            # Local/self-managed
-            self.driver = GraphDatabase.driver(
-                self.neo4j_uri,
-                auth=(self.neo4j_user, self.neo4j_password),
-                max_connection_lifetime=30 * 60,
-                max_connection_pool_size=50,
-                connection_acquisition_timeout=2 * 60,
-            )
+        self.driver = GraphDatabase.driver(self.neo4j_uri, **self._driver_config())
         
         # Test connection
         try:
@@ -62,29 +316,29 @@ class BioscienceKnowledgeGraph:
             print("Please check your Neo4j credentials")
             raise
         
-        # Simple entity patterns (no spaCy needed)
-        self.entity_patterns = {
-            'genes_proteins': [
-                r'\b[A-Z][A-Z0-9]{2,9}\b',  # Gene symbols
-                r'\b(?:protein|gene|mRNA|DNA|RNA)\b',  # Common terms
-            ],
-            'organisms': [
-                r'\b(?:mice|mouse|human|drosophila|arabidopsis|rat|zebrafish|cell|cells)\b',
-            ],
-            'conditions': [
-                r'\b(?:microgravity|spaceflight|radiation|hypoxia|hypergravity|control|treatment)\b',
-            ],
-            'measurements': [
-                r'\d+\.?\d*\s*(?:mm|cm|m|g|kg|mg|μm|nm|Gy|cGy|%)',
-            ],
-            'processes': [
-                r'\b(?:expression|transcription|metabolism|apoptosis|differentiation|proliferation)\b',
-            ]
-        }
+        # Module-level so extraction can run in worker processes
+        self.entity_patterns = ENTITY_PATTERNS
+        self.entity_vocabularies = ENTITY_VOCABULARIES
+        
+        # Read results cached per graph version: (version, *args) -> (expires_at, value)
+        self._graph_version = 0
+        self._read_cache = {}
         
         # Initialize Neo4j database
         self._initialize_neo4j()
 
+    def _driver_config(self) -> Dict:
+        """Connection settings for the Neo4j driver"""
+        # Cloud URIs (neo4j+s://) imply encryption; do NOT pass encrypted/trust
+        return {
+            'auth': (self.neo4j_user, self.neo4j_password),
+            'max_connection_lifetime': 30 * 60,
+            'max_connection_pool_size': 50,
+            # Fail fast when the pool is saturated instead of blocking a worker for minutes
+            'connection_acquisition_timeout': 5,
+            'keep_alive': True,
+        }
+
     def _initialize_neo4j(self):
         """Initialize Neo4j database with constraints and indexes"""
         with self.driver.session() as session:
@@ -94,7 +348,13 @@ class BioscienceKnowledgeGraph:
             
             # Create indexes for performance
             session.run("CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)")
+            # Range index lets ORDER BY e.importance DESC LIMIT n read the index backwards
+            session.run("CREATE INDEX entity_importance IF NOT EXISTS FOR (e:Entity) ON (e.importance)")
             session.run("CREATE INDEX article_title IF NOT EXISTS FOR (a:Article) ON (a.title)")
+            session.run(
+                "CREATE FULLTEXT INDEX article_text IF NOT EXISTS FOR (a:Article) "
+                "ON EACH [a.title, a.results_summary, a.results_full]"
+            )
             
             print("✓ Neo4j database initialized with constraints and indexes")
 
@@ -105,32 +365,19 @@ class BioscienceKnowledgeGraph:
 
     def extract_entities_fast(self, text: str) -> Dict[str, List[str]]:
         """Fast entity extraction using only regex patterns"""
-        entities = defaultdict(list)
-        
-        # Pattern-based extraction only (no spaCy)
-        for entity_type, patterns in self.entity_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                entities[entity_type].extend(matches)
-        
-        # Clean and deduplicate
-        for entity_type in entities:
-            entities[entity_type] = list(set([
-                e.strip().lower() for e in entities[entity_type] 
-                if len(e.strip()) > 2
-            ]))
-            
-        return dict(entities)
+        return extract_entities_fast(text)
 
-    def build_graph(self, articles: List[Dict]) -> Dict:
-        """Build the complete knowledge graph in Neo4j"""
+    def build_graph(self, articles: List[Dict], texts: List[str] = None) -> Dict:
+        """Build the complete knowledge graph in Neo4j.
+        texts optionally supplies each article's precomputed extraction text (aligned with articles).
+        """
         print("Building Neo4j knowledge graph...")
         
         # Clear existing data
         self._clear_neo4j_data()
         
         # Insert articles and entities
-        self._insert_articles_and_entities(articles)
+        self._insert_articles_and_entities(articles, texts)
         
         # Build relationships
         self._build_neo4j_relationships()
@@ -138,285 +385,283 @@ class BioscienceKnowledgeGraph:
         # Calculate importance scores
         self._calculate_neo4j_importance()
         
+        self._bump_graph_version()
+        
         # Get graph stats
         stats = self._get_neo4j_stats()
         
         print(f"✓ Built Neo4j graph with {stats['nodes']} nodes and {stats['edges']} edges")
         return stats
 
+    def _write(self, query: str, **params):
+        """Run a write query in a managed transaction (retried on transient errors)"""
+        with self.driver.session() as session:
+            session.execute_write(lambda tx: tx.run(query, **params).consume())
+
+    def _read(self, query: str, **params) -> List:
+        """Run a read query in a managed transaction and return its records"""
+        with self.driver.session(fetch_size=READ_FETCH_SIZE) as session:
+            return session.execute_read(lambda tx: list(tx.run(query, **params)))
+
+    def _bump_graph_version(self):
+        """Invalidate cached read results after the graph changes"""
+        self._graph_version += 1
+        self._read_cache.clear()
+
+    def _cached(self, key: Tuple, compute):
+        """Return compute() memoized for GRAPH_CACHE_TTL seconds within the current graph version"""
+        key = (self._graph_version,) + key
+        now = time.monotonic()
+        hit = self._read_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+        value = compute()
+        self._read_cache[key] = (now + GRAPH_CACHE_TTL, value)
+        return value
+
     def _clear_neo4j_data(self):
         """Clear existing Neo4j data"""
-        with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
-            print("✓ Cleared existing Neo4j data")
+        self._write(CLEAR_GRAPH_CYPHER)
+        print("✓ Cleared existing Neo4j data")
 
-    def _insert_articles_and_entities(self, articles: List[Dict]):
+    def _insert_articles_and_entities(self, articles: List[Dict], texts: List[str] = None):
         """Insert articles and entities into Neo4j"""
-        with self.driver.session() as session:
-            for article in articles:
-                if not article.get('has_results'):
-                    continue
-                
-                # Insert article
-                session.run(
-                    """
-                    MERGE (a:Article {article_id: $article_id})
-                    SET a.title = $title,
-                        a.link = $link,
-                        a.results_summary = $results_summary,
-                        a.results_full = $results_full
-                    """,
-                    article_id=article['article_id'],
-                    title=article.get('title', ''),
-                    link=article.get('link', ''),
-                    results_summary=article.get('results_summary', ''),
-                    results_full=article.get('results_full', ''),
-                )
-                
-                # Extract and insert entities
-                text = f"{article.get('title', '')} {article.get('results_full', '')} {article.get('results_summary', '')}"
-                entities = self.extract_entities_fast(text)
-                
-                for entity_type, entity_list in entities.items():
-                    for entity_name in entity_list:
-                        # Insert entity
-                        session.run(
-                            """
-                            MERGE (e:Entity {name: $name})
-                            SET e.type = $type,
-                                e.frequency = COALESCE(e.frequency, 0) + 1
-                            """,
-                            name=entity_name,
-                            type=entity_type,
-                        )
-                        
-                        # Connect entity to article
-                        session.run(
-                            """
-                            MATCH (a:Article {article_id: $article_id})
-                            MATCH (e:Entity {name: $entity_name})
-                            MERGE (a)-[:MENTIONS]->(e)
-                            """,
-                            article_id=article['article_id'],
-                            entity_name=entity_name,
-                        )
+        if texts is None:
+            texts = [
+                f"{a.get('title', '')} {a.get('results_full', '')} {a.get('results_summary', '')}"
+                for a in articles
+            ]
+        rows = [(a, t) for a, t in zip(articles, texts) if a.get('has_results')]
+        articles = [a for a, _ in rows]
+        texts = [t for _, t in rows]
+        
+        # Phase 1: extraction; texts seen by an earlier (self-heal) build are cache hits
+        extracted = extract_entities_many(texts)
+        
+        # Phase 2: aggregate in Python so every entity and (article, entity)
+        # pair is merged exactly once
+        entity_types = {}
+        entity_freq = Counter()
+        mentions = []
+        for article, entities in zip(articles, extracted):
+            # Last type wins, as when every mention SET e.type: the vocabulary
+            # types come after the catch-all gene pattern, so they take precedence
+            names = {}
+            for entity_type, entity_names in entities.items():
+                for name in entity_names:
+                    names[name] = entity_type
+            for name, entity_type in names.items():
+                entity_types[name] = entity_type
+                entity_freq[name] += 1
+                mentions.append({'article_id': article['article_id'], 'name': name})
+        
+        article_rows = [self._article_row(a) for a in articles]
+        entity_rows = [
+            {'name': name, 'type': entity_types[name], 'frequency': freq}
+            for name, freq in entity_freq.items()
+        ]
+        
+        # Phase 3: pure batched inserts, several transactions in flight at once
+        self._write_graph(article_rows, entity_rows, mentions)
         
         print("✓ Inserted articles and entities into Neo4j")
 
+    def _article_row(self, article: Dict) -> Dict:
+        """Build the UNWIND row for an article node"""
+        return {
+            'article_id': article['article_id'],
+            'title': article.get('title', ''),
+            'link': article.get('link', ''),
+            'results_summary': article.get('results_summary', ''),
+            'results_full': article.get('results_full', ''),
+        }
+
+    def _write_graph(self, article_rows: List[Dict], entity_rows: List[Dict], mention_rows: List[Dict]):
+        """Write nodes, then MENTIONS edges, as concurrent batched transactions
+        (at most GRAPH_WRITE_CONCURRENCY in flight)
+        """
+        # Threads rather than asyncio.run, which fails when a second gevent greenlet
+        # reaches it; under gevent these threads are greenlets sharing the hub.
+        # The sync driver is thread-safe and each write borrows its own pooled session
+        def batched(query, rows, size):
+            return [(query, rows[i:i + size]) for i in range(0, len(rows), size)]
+        
+        def write_batch(job):
+            query, batch = job
+            # execute_write retries on deadlocks between concurrent batches
+            self._write(query, batch=batch)
+        
+        with ThreadPoolExecutor(max_workers=GRAPH_WRITE_CONCURRENCY) as executor:
+            # Article and entity nodes are independent; edges need both to exist
+            list(executor.map(write_batch,
+                              batched(INSERT_ARTICLES_CYPHER, article_rows, ARTICLE_BATCH_SIZE)
+                              + batched(INSERT_ENTITIES_CYPHER, entity_rows, ROW_BATCH_SIZE)))
+            list(executor.map(write_batch, batched(INSERT_MENTIONS_CYPHER, mention_rows, ROW_BATCH_SIZE)))
+
     def _build_neo4j_relationships(self):
         """Build relationships between entities in Neo4j"""
-        with self.driver.session() as session:
-            # Find co-occurring entities and create relationships
-            session.run(
-                """
-                MATCH (e1:Entity)-[:MENTIONS]-(a:Article)-[:MENTIONS]-(e2:Entity)
-                WHERE e1.name < e2.name
-                WITH e1, e2, count(a) as co_occurrence_count
-                WHERE co_occurrence_count >= 2
-                MERGE (e1)-[r:CO_OCCURS_WITH]->(e2)
-                SET r.weight = toFloat(co_occurrence_count),
-                    r.co_occurrence_count = co_occurrence_count,
-                    r.shared_articles = co_occurrence_count
-                """
-            )
-        
+        # Find co-occurring entities and create relationships
+        self._write(BUILD_RELATIONSHIPS_CYPHER)
+        self._bump_graph_version()
         print("✓ Built entity relationships in Neo4j")
 
     def _calculate_neo4j_importance(self):
         """Calculate importance scores using Neo4j algorithms"""
-        with self.driver.session() as session:
-            # Calculate degree using Neo4j 5-compatible syntax
-            session.run(
-                """
-                MATCH (e:Entity)
-                WITH e, size([(e)-[:CO_OCCURS_WITH]-() | 1]) AS deg
-                SET e.degree = deg
-                """
-            )
-            
-            # Calculate importance score (simplified for speed)
-            session.run(
-                """
-                MATCH (e:Entity)
-                WITH e, coalesce(e.frequency, 0) AS freq, coalesce(e.degree, 0) AS deg
-                SET e.importance = freq * log(toFloat(deg) + 1)
-                """
-            )
+        def update_scores(tx):
+            # Degree and importance share one transaction
+            for query in (RESET_DEGREE_CYPHER, DEGREE_CYPHER, IMPORTANCE_CYPHER):
+                tx.run(query).consume()
         
+        with self.driver.session() as session:
+            session.execute_write(update_scores)
+        self._bump_graph_version()
         print("✓ Calculated importance scores in Neo4j")
 
     def _get_neo4j_stats(self) -> Dict:
         """Get Neo4j graph statistics"""
-        with self.driver.session() as session:
-            result = session.run(
-                """
-                MATCH (n)
-                RETURN 
-                    count(n) as total_nodes,
-                    count { (n)-[r]-() } as total_edges
-                """
-            ).single()
-            
-            if not result:
-                return {'nodes': 0, 'edges': 0}
-            
-            total_nodes = result.get('total_nodes', 0)
-            total_edges = result.get('total_edges', 0)
-            try:
-                undirected_edges = (total_edges or 0) // 2
-            except Exception:
-                undirected_edges = 0
-            
-            return {
-                'nodes': total_nodes or 0,
-                'edges': undirected_edges,
-            }
+        records = self._read(STATS_CYPHER)
+        if not records:
+            return {'nodes': 0, 'edges': 0}
+        
+        result = records[0]
+        return {
+            'nodes': result['total_nodes'] or 0,
+            'edges': result['total_edges'] or 0,
+        }
 
     def get_top_entities(self, n: int = 20) -> List[Dict]:
         """Get top N most important entities from Neo4j"""
-        with self.driver.session() as session:
-            result = session.run(
-                """
-                MATCH (e:Entity)
-                WHERE e.importance IS NOT NULL
-                RETURN e.name as name, e.importance as importance, 
-                       e.frequency as frequency, e.degree as degree
-                ORDER BY e.importance DESC
-                LIMIT $limit
-                """,
-                limit=n,
-            )
-            
-            entities = []
-            for record in result:
-                entities.append(
-                    {
-                        'name': record['name'],
-                        'importance': record['importance'],
-                        'frequency': record['frequency'],
-                        'degree': record['degree'],
-                    }
-                )
-            
-            return entities
+        return self._cached(('top_entities', n), lambda: self._query_top_entities(n))
+
+    def _query_top_entities(self, n: int) -> List[Dict]:
+        return [
+            {
+                'name': record['name'],
+                'importance': record['importance'],
+                'frequency': record['frequency'],
+                'degree': record['degree'],
+            }
+            for record in self._read(TOP_ENTITIES_CYPHER, limit=n)
+        ]
 
     def get_entity_relationships(self, entity: str, max_connections: int = 10) -> List[Dict]:
         """Get relationships for a specific entity from Neo4j"""
-        with self.driver.session() as session:
-            result = session.run(
-                """
-                MATCH (e1:Entity {name: $entity_name})-[r:CO_OCCURS_WITH]-(e2:Entity)
-                RETURN e2.name as target, r.weight as weight, 
-                       r.co_occurrence_count as co_occurrence_count,
-                       r.shared_articles as shared_articles
-                ORDER BY r.weight DESC
-                LIMIT $limit
-                """,
-                entity_name=entity,
-                limit=max_connections,
-            )
-            
-            relationships = []
-            for record in result:
-                relationships.append(
-                    {
-                        'target': record['target'],
-                        'weight': record['weight'],
-                        'co_occurrence_count': record['co_occurrence_count'],
-                        'shared_articles': record['shared_articles'],
-                    }
-                )
-            
-            return relationships
+        return [
+            {
+                'target': record['target'],
+                'weight': record['weight'],
+                'co_occurrence_count': record['co_occurrence_count'],
+                'shared_articles': record['shared_articles'],
+            }
+            for record in self._read(ENTITY_RELATIONSHIPS_CYPHER, entity_name=entity, limit=max_connections)
+        ]
+
+    def get_entity_articles(self, entity: str, limit: int = 10) -> Dict:
+        """Get the articles mentioning an entity (via MENTIONS edges) and their total count"""
+        records = self._read(ENTITY_ARTICLES_CYPHER, entity_name=entity, limit=limit)
+        return {
+            'related_articles': [
+                {
+                    'article_id': record['article_id'],
+                    'title': record['title'],
+                    'link': record['link'],
+                }
+                for record in records
+            ],
+            'total_articles': records[0]['total_articles'] if records else 0,
+        }
+
+    def search_article_text(self, text: str, limit: int = 10) -> Dict:
+        """Find articles whose title or results contain text as a phrase, via the fulltext index"""
+        escaped = text.strip().replace('\\', '\\\\').replace('"', '\\"')
+        records = self._read(ARTICLE_TEXT_SEARCH_CYPHER, query=f'"{escaped}"', limit=limit)
+        if not records:
+            return {'related_articles': [], 'total_articles': 0}
+        return {
+            'related_articles': records[0]['related_articles'],
+            'total_articles': records[0]['total_articles'],
+        }
 
     def get_graph_data(self) -> Dict:
         """Get graph data for visualization from Neo4j.
         Returns a cohesive subgraph: first selects top entities by importance (cap for perf),
         then returns ALL relations among those nodes (no artificial LIMIT on edges).
         """
-        with self.driver.session() as session:
-            # Get nodes
-            nodes_result = session.run(
-                """
-                MATCH (e:Entity)
-                WHERE e.importance IS NOT NULL
-                RETURN e.name as id, e.name as label, e.importance as importance,
-                       e.frequency as frequency, e.degree as degree
-                ORDER BY e.importance DESC
-                LIMIT 150
-                """
-            )
-            
-            nodes = []
-            for record in nodes_result:
-                nodes.append(
-                    {
-                        'id': record['id'],
-                        'label': record['label'],
-                        'size': (record['importance'] or 1) * 5,
-                        'frequency': record['frequency'] or 0,
-                        'degree': record['degree'] or 0,
-                    }
-                )
-            
-            # Get edges among the selected nodes only (no LIMIT)
-            node_names = [n['id'] for n in nodes]
-            edges_result = session.run(
-                """
-                MATCH (e1:Entity)-[r:CO_OCCURS_WITH]-(e2:Entity)
-                WHERE e1.name IN $names AND e2.name IN $names
-                RETURN e1.name as source, e2.name as target, r.weight as weight,
-                       r.co_occurrence_count as co_occurrence_count
-                """,
-                names=node_names,
-            )
-            
-            edges = []
-            for record in edges_result:
-                edges.append(
-                    {
-                        'source': record['source'],
-                        'target': record['target'],
-                        'weight': record['weight'] or 1,
-                        'co_occurrence_count': record['co_occurrence_count'] or 0,
-                    }
-                )
-            
-            return {
-                'nodes': nodes,
-                'edges': edges,
-                'stats': {
-                    'total_nodes': len(nodes),
-                    'total_edges': len(edges),
-                    'density': len(edges) / max(len(nodes) * (len(nodes) - 1) / 2, 1) if len(nodes) > 1 else 0,
-                },
+        return self._cached(('graph_data',), self._query_graph_data)
+
+    def _query_graph_data(self) -> Dict:
+        records = self._read(GRAPH_DATA_CYPHER, limit=GRAPH_NODE_LIMIT)
+        record = records[0] if records else {'nodes': [], 'edges': []}
+        
+        nodes = [
+            {
+                'id': node['id'],
+                'label': node['id'],
+                'size': (node['importance'] or 1) * 5,
+                'frequency': node['frequency'] or 0,
+                'degree': node['degree'] or 0,
+            }
+            for node in record['nodes']
+        ]
+        edges = [
+            {
+                'source': edge['source'],
+                'target': edge['target'],
+                'weight': edge['weight'] or 1,
+                'co_occurrence_count': edge['co_occurrence_count'] or 0,
             }
+            for edge in record['edges']
+        ]
+        
+        return {
+            'nodes': nodes,
+            'edges': edges,
+            'stats': {
+                'total_nodes': len(nodes),
+                'total_edges': len(edges),
+                'density': len(edges) / max(len(nodes) * (len(nodes) - 1) / 2, 1) if len(nodes) > 1 else 0,
+            },
+        }
 
     def find_communities(self) -> Dict:
         """Find communities/clusters in the Neo4j graph"""
-        with self.driver.session() as session:
-            # Simple clustering based on entity types and degrees
-            result = session.run(
-                """
-                MATCH (e:Entity)
-                WHERE e.importance IS NOT NULL
-                RETURN e.name as name, e.type as type, e.degree as degree
-                ORDER BY e.importance DESC
-                """
-            )
-            
-            communities = defaultdict(list)
-            for record in result:
-                entity_name = record['name']
-                entity_type = record['type']
-                degree = record['degree'] or 0
-                
-                # Cluster by type and degree
-                if degree > 5:
-                    communities[f"high_degree_{entity_type}"].append(entity_name)
-                elif degree > 2:
-                    communities[f"medium_degree_{entity_type}"].append(entity_name)
-                else:
-                    communities[f"low_degree_{entity_type}"].append(entity_name)
+        return self._cached(('communities',), self._query_communities)
+
+    def _query_communities(self) -> Dict:
+        try:
+            return self._louvain_communities()
+        except Exception as e:
+            print(f"ℹ️ GDS Louvain unavailable, falling back to degree clusters: {e}")
+            return self._degree_communities()
+
+    def _louvain_communities(self) -> Dict:
+        """Modularity-based communities from GDS Louvain, keyed 'community_<id>'"""
+        graph_name = f"kg_communities_{uuid.uuid4().hex}"
+        with self.driver.session(fetch_size=READ_FETCH_SIZE) as session:
+            session.run(LOUVAIN_PROJECT_CYPHER, graph_name=graph_name).consume()
+            try:
+                return {
+                    f"community_{record['communityId']}": record['members']
+                    for record in session.run(LOUVAIN_STREAM_CYPHER, graph_name=graph_name)
+                }
+            finally:
+                session.run(LOUVAIN_DROP_CYPHER, graph_name=graph_name).consume()
+
+    def _degree_communities(self) -> Dict:
+        """Fallback: cluster entities by type and degree"""
+        # Simple clustering based on entity types and degrees
+        communities = defaultdict(list)
+        for record in self._read(COMMUNITY_ENTITIES_CYPHER):
+            entity_name = record['name']
+            entity_type = record['type']
+            degree = record['degree'] or 0
             
-            return dict(communities)
\ No newline at end of file
+            # Cluster by type and degree
+            if degree > 5:
+                communities[f"high_degree_{entity_type}"].append(entity_name)
+            elif degree > 2:
+                communities[f"medium_degree_{entity_type}"].append(entity_name)
+            else:
+                communities[f"low_degree_{entity_type}"].append(entity_name)
+        
+        return dict(communities)
@@ -0,0 +1,74 @@
+"""
+Text matching helpers shared by the API and AI services
+Multi-keyword counting and whole-word vocabulary matching use a single
+Aho-Corasick pass when pyahocorasick is installed
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; falls back to one str.count per keyword
+    ahocorasick = None
+
+
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """Build (once per keyword set) an automaton reporting each keyword it matches"""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def count_keywords(text: str, keywords: Iterable[str]) -> Dict[str, int]:
+    """Count occurrences of each keyword in text with one scan of the text"""
+    keywords = tuple(keywords)
+    if ahocorasick is None:
+        return {kw: text.count(kw) for kw in keywords}
+
+    counts = dict.fromkeys(keywords, 0)
+    for _, kw in _keyword_automaton(keywords).iter(text):
+        counts[kw] += 1
+    return counts
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+class WordMatcher:
+    """Finds which words of a fixed vocabulary occur as whole words in lowercased text"""
+
+    def __init__(self, words: Iterable[str]):
+        self.words = tuple(dict.fromkeys(w.lower() for w in words))
+        self._automaton = None
+        self._pattern = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word in self.words:
+                self._automaton.add_word(word, word)
+            self._automaton.make_automaton()
+        else:
+            # Longest first so e.g. 'cells' is preferred over 'cell'
+            alternation = "|".join(re.escape(w) for w in sorted(self.words, key=len, reverse=True))
+            self._pattern = re.compile(rf"\b(?:{alternation})\b")
+
+    def find(self, text_lower: str) -> Set[str]:
+        """Return the vocabulary words found in text_lower, respecting word boundaries"""
+        if self._automaton is None:
+            return set(self._pattern.findall(text_lower))
+
+        found = set()
+        last = len(text_lower) - 1
+        for end, word in self._automaton.iter(text_lower):
+            start = end - len(word) + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(text_lower[end + 1]):
+                continue
+            found.add(word)
+        return found